@@ -0,0 +1,360 @@
+from .constants import QUOTE_API_URL, TRX_API_URL, TRANS_BASE_URL, DATA_BASE_URL, POOL_IDS_BATCH
+from .base import RaydiumSwapBase
+from .keys import _swap_payload
+
+import asyncio
+import copy
+import aiohttp
+import orjson
+from aiohttp import ClientResponse
+import logging
+
+
+# Generate dict from response if successful, None otherwise
+# ----------------------------------------------------------------------
+async def _parse_response(resp: ClientResponse, logger: logging.Logger) -> dict | None:
+    if not resp.status == 200:
+        logger.error("Response error status code: %s", resp.status)
+        return None
+    resp_js = orjson.loads(await resp.read())
+
+    if not resp_js.get("success"):
+        logger.error("Response unsuccessful id: %s", resp_js.get("id"))
+        return None
+
+    return resp_js
+
+
+class AsyncRaydiumSwap(RaydiumSwapBase):
+    """
+    Asyncio variant of RaydiumSwap using aiohttp.
+    Independent requests (quote and auto-fee) are issued concurrently.
+    """
+
+    _logger = logging.getLogger("solana.AsyncRaydiumSwap")
+
+    def __init__(
+        self,
+        price_impact_max: float = 0.1,
+        slippage_bps: int = 10,
+        timeout: int = 10,
+        fee_ttl: float = 5.0,
+        pool_ttl: float = 60.0,
+        quote_ttl: float = 1.0,
+        prewarm: bool = True,
+    ):
+        super().__init__(
+            price_impact_max=price_impact_max,
+            slippage_bps=slippage_bps,
+            timeout=timeout,
+            fee_ttl=fee_ttl,
+            pool_ttl=pool_ttl,
+            quote_ttl=quote_ttl,
+        )
+
+        # self._session created lazily, aiohttp needs a running event loop
+        # ----------------------------------------------------------------------
+        self._session: aiohttp.ClientSession | None = None
+        self._prewarm_on_enter = prewarm
+
+    # Context manager
+    # ==================================================================
+    async def __aenter__(self):
+        if self._prewarm_on_enter:
+            await self.prewarm()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    # Close the shared HTTP session
+    # ---------------------------------------------------------
+    async def close(self):
+        """
+        Close the underlying HTTP session and release pooled connections.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    # Public
+    # ==================================================================
+    # Open connections (DNS, TCP, TLS) to both API hosts ahead of the first call
+    # ---------------------------------------------------------
+    async def prewarm(self):
+        """
+        Open pooled connections to the Raydium API hosts.
+        Called on `async with` entry when prewarm=True.
+        """
+        await asyncio.gather(*[self._head(url) for url in (TRANS_BASE_URL, DATA_BASE_URL)])
+
+    # Create transaction for signing
+    # ---------------------------------------------------------
+    async def generate_transaction(
+        self,
+        input_mint: str,
+        output_mint: str,
+        wallet_pub_key: str,
+        amount_in: int,
+    ) -> str:
+        """
+        Generate transaction for signing
+
+        Args:
+            input_mint (str): SPL token mint address
+            output_mint (str): SPL token mint address
+            wallet_pub_key (str): Your walet addres/public key
+            amount_in (e.g. USDC = 6 decimals): amount in smallest units
+
+        Returns:
+            str:
+                Transaction for signing
+        """
+        try:
+            # Quote and auto-fee are independent, fetch them concurrently
+            compute_resp, priority_fee = await asyncio.gather(
+                self._compute_routes(
+                    input_mint, output_mint, amount_in, enforce_price_impact=True
+                ),
+                self._unit_price_micro_lamports("h"),
+            )
+            if not compute_resp:
+                return compute_resp
+
+            if not priority_fee:
+                priority_fee = "15000"
+
+            payload = _swap_payload(
+                wallet_pub_key, input_mint, output_mint, priority_fee, compute_resp
+            )
+            session = self._get_session()
+            async with session.post(
+                TRX_API_URL,
+                data=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=self._client_timeout(),
+            ) as resp_trx:
+                resp_js = await _parse_response(resp_trx, self._logger)
+            if resp_js is None:
+                return False
+
+            return resp_js["data"]["transaction"]
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, ValueError) as e:
+            self._logger.error(f"Raydium generate_transaction() error: {e}")
+            return False
+
+    # Return price
+    # ---------------------------------------------------------
+    async def get_price(
+        self,
+        input_mint: str,
+        output_mint: str,
+        amount_in: int = 1_000_000_000
+    ) -> float:
+        """
+        Compute price after routing. See RaydiumSwap.get_price().
+        """
+        try:
+            resp_js = await self._compute_routes(input_mint, output_mint, amount_in)
+            if not resp_js:
+                return resp_js # None: no route, False: error
+
+            d = resp_js["data"]
+            in_amm = float(d["inputAmount"])
+            out_amm = float(d["outputAmount"])
+            price = in_amm / out_amm
+
+            return price
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, ValueError, ZeroDivisionError) as e:
+            self._logger.error(f"Raydium get_price() error: {e}")
+            return False
+
+    # Get list of rpcs
+    # ---------------------------------------------------------
+    async def get_rpcs(self) -> list[dict]:
+        """
+        List of available rpcs. See RaydiumSwap.get_rpcs().
+        """
+        try:
+            url = f"{DATA_BASE_URL}/main/rpcs"
+            session = self._get_session()
+            async with session.get(url, timeout=self._client_timeout()) as resp:
+                resp_js = await _parse_response(resp, self._logger)
+            if resp_js is None:
+                return False
+
+            return resp_js["data"]["rpcs"]
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, ValueError) as e:
+            self._logger.error(f"Raydium get_rpcs() error: {e}")
+            return False
+
+    # Return data of pools used in routing
+    # ---------------------------------------------------------
+    async def get_pools_info(
+        self,
+        input_mint: str,
+        output_mint: str,
+        amount_in: int = 1_000_000_000
+    ) -> list[dict]:
+        """
+        Full info of pools used in routing. See RaydiumSwap.get_pools_info().
+        """
+        try:
+            url = f"{DATA_BASE_URL}/pools/info/ids"
+
+            routes = await self.get_routes(input_mint, output_mint, amount_in)
+            if not routes:
+                return routes
+            ids = []
+            for route in routes:
+                ids.append(route["poolId"])
+
+            missing = self._missing_pool_ids(ids)
+            # Fetch uncached pools in batches concurrently
+            results = await asyncio.gather(*[
+                self._fetch_pools(url, missing[i:i + POOL_IDS_BATCH])
+                for i in range(0, len(missing), POOL_IDS_BATCH)
+            ])
+            for resp_js in results:
+                if resp_js is None:
+                    return False
+                self._store_pools(resp_js["data"])
+
+            return self._cached_pools(ids)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, ValueError) as e:
+            self._logger.error(f"Raydium get_pools_info() error: {e}")
+            return False
+
+    # Return rout plan
+    # ---------------------------------------------------------
+    async def get_routes(
+        self,
+        input_mint: str,
+        output_mint: str,
+        amount_in: int = 1_000_000_000
+    ) -> list[dict]:
+        """
+        Compute exchange routs. See RaydiumSwap.get_routes().
+        """
+        try:
+            resp_js = await self._compute_routes(input_mint, output_mint, amount_in)
+            if not resp_js:
+                return resp_js # None: no route, False: error
+
+            # Copy so callers can not modify the cached quote
+            return copy.deepcopy(resp_js["data"]["routePlan"])
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, ValueError) as e:
+            self._logger.error(f"Raydium get_routes() error: {e}")
+            return False
+
+    # Helpers
+    # ==================================================================
+    # Get (or create) the shared aiohttp session
+    # ---------------------------------------------------------
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+            )
+        return self._session
+
+    # Request timeout
+    # ---------------------------------------------------------
+    def _client_timeout(self) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(total=self._timeout)
+
+    # Get swapResponse routes for making a swap
+    # ---------------------------------------------------------
+    async def _compute_routes(
+        self,
+        input_mint: str,
+        output_mint: str,
+        amount_in: int,
+        enforce_price_impact: bool = False,
+    ) -> dict:
+        """
+        Compute exchange routs.
+
+        Args:
+            input_mint: SPL token mint address (string)
+            output_mint: SPL token mint address (string)
+            amount_in: amount in smallest units (e.g. USDC = 6 decimals)
+            enforce_price_impact: return None if price impact is over the limit
+
+        Returns:
+            swapResponse, None if there is no route, False on error.
+            The dict is shared with the quote cache and must not be modified.
+        """
+        try:
+            key = self._quote_key(input_mint, output_mint, amount_in)
+            resp_js = self._cached_quote(key)
+            if resp_js is None:
+                params = {
+                    "inputMint": input_mint,
+                    "outputMint": output_mint,
+                    "amount": amount_in,
+                    "slippageBps": self._slippage_bps,
+                    "txVersion": "V0"
+                }
+
+                session = self._get_session()
+                async with session.get(
+                    QUOTE_API_URL,
+                    params=params,
+                    timeout=self._client_timeout(),
+                ) as resp:
+                    resp_js = await _parse_response(resp, self._logger)
+                if resp_js is None:
+                    return False
+
+                self._store_quote(key, resp_js)
+
+            return self._check_quote(resp_js, enforce_price_impact)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, ValueError) as e:
+            self._logger.error(f"Raydium _compute_routes() error: {e}")
+            return False
+
+    # Get auto-fee calculation select m h vh
+    # ---------------------------------------------------------
+    async def _unit_price_micro_lamports(self, select: str = "h"):
+        fee = self._cached_fee(select)
+        if fee is not None:
+            return fee
+
+        try:
+            url = f"{DATA_BASE_URL}/main/auto-fee"
+            session = self._get_session()
+            async with session.get(url, timeout=self._client_timeout()) as resp:
+                resp_js = await _parse_response(resp, self._logger)
+            if resp_js is None:
+                return False
+
+            return self._store_fees(resp_js["data"]["default"], select)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, ValueError) as e:
+            self._logger.error(f"Raydium _unit_price_micro_lamports() error: {e}")
+            return False
+
+    # HEAD request, errors only logged
+    # ---------------------------------------------------------
+    async def _head(self, url: str):
+        try:
+            session = self._get_session()
+            async with session.head(url, timeout=aiohttp.ClientTimeout(total=min(self._timeout, 2))):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._logger.debug("Raydium prewarm %s failed: %s", url, e)
+
+    # Request one batch of pool info
+    # ---------------------------------------------------------
+    async def _fetch_pools(self, url: str, ids: list[str]) -> dict | None:
+        params= {"ids" : ",".join(ids)}
+        session = self._get_session()
+        async with session.get(url, params=params, timeout=self._client_timeout()) as resp:
+            return await _parse_response(resp, self._logger)
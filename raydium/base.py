@@ -0,0 +1,151 @@
+from .constants import POOL_CACHE_SIZE
+
+from collections import OrderedDict
+import copy
+import threading
+import time
+
+
+class RaydiumSwapBase:
+    """
+    Settings, caches and I/O free helpers shared by RaydiumSwap and AsyncRaydiumSwap.
+    Subclasses provide the HTTP requests and a class level self._logger.
+    """
+
+    def __init__(
+        self,
+        price_impact_max: float = 0.1,
+        slippage_bps: int = 10,
+        timeout: int = 10,
+        fee_ttl: float = 5.0,
+        pool_ttl: float = 60.0,
+        quote_ttl: float = 1.0,
+    ):
+        self._slippage_bps = slippage_bps
+        self._timeout = timeout
+        self._price_impact_max = float(price_impact_max)
+
+        # self._fee_cache auto-fee tiers {select: (timestamp, fee)}
+        # ----------------------------------------------------------------------
+        self._fee_cache: dict[str, tuple[float, str]] = {}
+        self._fee_ttl = fee_ttl
+
+        # self._pool_cache LRU of pool info {pool_id: (timestamp, pool)}
+        # ----------------------------------------------------------------------
+        self._pool_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._pool_ttl = pool_ttl
+
+        # self._quote_cache swapResponse {(in, out, amount, slippage): (timestamp, resp)}
+        # ----------------------------------------------------------------------
+        self._quote_cache: dict[tuple, tuple[float, dict]] = {}
+        self._quote_ttl = quote_ttl
+
+        # self._cache_lock guards the caches when an instance is shared between threads
+        # ----------------------------------------------------------------------
+        self._cache_lock = threading.Lock()
+
+    # Public
+    # ==================================================================
+    # Drop cached quotes
+    # ---------------------------------------------------------
+    def invalidate_quote_cache(self):
+        """
+        Clear cached quotes so the next call fetches a fresh swapResponse.
+        """
+        with self._cache_lock:
+            self._quote_cache.clear()
+
+    # Helpers
+    # ==================================================================
+    # Quote cache key
+    # ---------------------------------------------------------
+    def _quote_key(self, input_mint: str, output_mint: str, amount_in: int) -> tuple:
+        return (input_mint, output_mint, amount_in, self._slippage_bps)
+
+    # Cached swapResponse, None if missing or expired
+    # ---------------------------------------------------------
+    def _cached_quote(self, key: tuple) -> dict | None:
+        with self._cache_lock:
+            ts, resp_js = self._quote_cache.get(key, (0, None))
+            if time.monotonic() - ts < self._quote_ttl:
+                return resp_js
+            return None
+
+    # Store swapResponse in the quote cache
+    # ---------------------------------------------------------
+    def _store_quote(self, key: tuple, resp_js: dict):
+        with self._cache_lock:
+            now = time.monotonic()
+            # Drop expired quotes so the cache does not grow unbounded
+            for k in [k for k, (t, _) in self._quote_cache.items() if now - t >= self._quote_ttl]:
+                del self._quote_cache[k]
+            self._quote_cache[key] = (now, resp_js)
+
+    # swapResponse, None if there is no route or the price impact is rejected
+    # ---------------------------------------------------------
+    def _check_quote(self, resp_js: dict, enforce_price_impact: bool) -> dict | None:
+        if resp_js["data"] is None: # no route
+            return None
+
+        pi = float(resp_js["data"]["priceImpactPct"])
+        if pi > self._price_impact_max:
+            self._logger.warning(f"Price impact is higher than the limit {pi} > {self._price_impact_max}")
+            if enforce_price_impact:
+                return None
+        return resp_js
+
+    # Cached auto-fee tier, None if missing or expired
+    # ---------------------------------------------------------
+    def _cached_fee(self, select: str):
+        with self._cache_lock:
+            ts, val = self._fee_cache.get(select, (0, None))
+            if time.monotonic() - ts < self._fee_ttl:
+                return val
+            return None
+
+    # Cache all auto-fee tiers from one response
+    # ---------------------------------------------------------
+    def _store_fees(self, fees: dict, select: str):
+        with self._cache_lock:
+            now = time.monotonic()
+            for tier, fee in fees.items():
+                self._fee_cache[tier] = (now, fee)
+            return fees[select]
+
+    # Pool ids not in the pool info cache (or expired)
+    # ---------------------------------------------------------
+    def _missing_pool_ids(self, ids: list[str]) -> list[str]:
+        with self._cache_lock:
+            now = time.monotonic()
+            missing = []
+            for pool_id in ids:
+                ts, _ = self._pool_cache.get(pool_id, (0, None))
+                if now - ts >= self._pool_ttl and pool_id not in missing:
+                    missing.append(pool_id)
+            return missing
+
+    # Store pool info in the LRU cache
+    # ---------------------------------------------------------
+    def _store_pools(self, pools: list[dict]):
+        with self._cache_lock:
+            now = time.monotonic()
+            for pool in pools:
+                if not pool:
+                    continue
+                self._pool_cache[pool["id"]] = (now, pool)
+                self._pool_cache.move_to_end(pool["id"])
+            while len(self._pool_cache) > POOL_CACHE_SIZE:
+                self._pool_cache.popitem(last=False)
+
+    # Copies of cached pool info in the order of ids, None if unknown
+    # ---------------------------------------------------------
+    def _cached_pools(self, ids: list[str]) -> list[dict]:
+        with self._cache_lock:
+            pools = []
+            for pool_id in ids:
+                _, pool = self._pool_cache.get(pool_id, (0, None))
+                if pool is not None:
+                    self._pool_cache.move_to_end(pool_id)
+                # Copy so callers can not modify the cached pool info
+                pools.append(copy.deepcopy(pool))
+            return pools
@@ -3,4 +3,7 @@ TRANS_BASE_URL = "https://transaction-v1.raydium.io"
 TRX_API_URL = f"{TRANS_BASE_URL}/transaction/swap-base-in"
 QUOTE_API_URL = f"{TRANS_BASE_URL}/compute/swap-base-in"
 
-DATA_BASE_URL = "https://api-v3.raydium.io"
\ No newline at end of file
+DATA_BASE_URL = "https://api-v3.raydium.io"
+
+POOL_IDS_BATCH = 20     # pool ids per /pools/info/ids request
+POOL_CACHE_SIZE = 1024  # max pools kept in the pool info cache
@@ -0,0 +1,50 @@
+import functools
+from types import MappingProxyType
+
+import orjson
+
+from solders.pubkey import Pubkey
+from spl.token.instructions import get_associated_token_address
+
+
+# Memoized key helpers, both are pure and Pubkey is immutable
+# ----------------------------------------------------------------------
+@functools.lru_cache(maxsize=4096)
+def _pubkey(s: str) -> Pubkey:
+    return Pubkey.from_string(s)
+
+
+@functools.lru_cache(maxsize=4096)
+def _ata(wallet_str: str, mint_str: str) -> Pubkey:
+    return get_associated_token_address(_pubkey(wallet_str), _pubkey(mint_str))
+
+
+# Static part of the swap payload per wallet and pair, read-only since it is
+# shared by every call through the cache
+# ----------------------------------------------------------------------
+@functools.lru_cache(maxsize=4096)
+def _payload_static(wallet_str: str, input_mint: str, output_mint: str) -> MappingProxyType:
+    return MappingProxyType({
+        "wallet": str(_pubkey(wallet_str)),
+        "inputAccount": str(_ata(wallet_str, input_mint)),
+        "outputAccount": str(_ata(wallet_str, output_mint)),
+        "txVersion": "V0",
+        "wrapSol" : True,
+        "unwrapSol": True,
+    })
+
+
+# Swap transaction request body
+# ----------------------------------------------------------------------
+def _swap_payload(
+    wallet_str: str,
+    input_mint: str,
+    output_mint: str,
+    priority_fee: str,
+    compute_resp: dict,
+) -> bytes:
+    return orjson.dumps({
+        **_payload_static(wallet_str, input_mint, output_mint),
+        "computeUnitPriceMicroLamports": priority_fee,
+        "swapResponse": compute_resp
+    })
@@ -1,32 +1,124 @@
-from .constants import QUOTE_API_URL, TRX_API_URL, DATA_BASE_URL
+from .constants import QUOTE_API_URL, TRX_API_URL, TRANS_BASE_URL, DATA_BASE_URL, POOL_IDS_BATCH
+from .base import RaydiumSwapBase
+from .keys import _swap_payload
 
+import copy
+import orjson
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 
-from solders.pubkey import Pubkey
-from spl.token.instructions import get_associated_token_address
+try:
+    import httpx # optional, http_client="httpx" (pip install httpx[http2])
+except ImportError:
+    httpx = None
 
 
-class RaydiumSwap:
+# Errors handled (logged, False returned) by the request methods
+# ----------------------------------------------------------------------
+_REQUEST_ERRORS = (requests.RequestException, KeyError, ValueError)
+if httpx is not None:
+    _REQUEST_ERRORS += (httpx.HTTPError,)
+
+
+# Generate dict from response if successful, None otherwise
+# ----------------------------------------------------------------------
+def _parse_response(resp: "Response | httpx.Response", logger: logging.Logger) -> dict | None:
+    # Retryable codes only get here once the session retries are exhausted
+    if not resp.status_code == 200:
+        logger.error("Response error status code: %s", resp.status_code)
+        return None
+    resp_js = orjson.loads(resp.content)
+
+    if not resp_js.get("success"):
+        logger.error("Response unsuccessful id: %s", resp_js.get("id"))
+        return None
+
+    return resp_js
+
+
+class RaydiumSwap(RaydiumSwapBase):
     """
     Raydium swap transaction generator using Raydium v3 swap API.
     Handles CLMM and AMM automatically.
     """
 
+    _logger = logging.getLogger("solana.RaydiumSwap")
+
     def __init__(
         self,
         price_impact_max: float = 0.1, 
         slippage_bps: int = 10,
         timeout: int = 10,
+        fee_ttl: float = 5.0,
+        pool_ttl: float = 60.0,
+        quote_ttl: float = 1.0,
+        http_client: str = "requests",
+        prewarm: bool = True,
     ):
-        self._slippage_bps = slippage_bps
-        self._timeout = timeout
-        self._price_impact_max = price_impact_max
-        
-        # self._logger
+        super().__init__(
+            price_impact_max=price_impact_max,
+            slippage_bps=slippage_bps,
+            timeout=timeout,
+            fee_ttl=fee_ttl,
+            pool_ttl=pool_ttl,
+            quote_ttl=quote_ttl,
+        )
+
+        # self._session shared HTTP session (keep-alive, connection pooling)
         # ----------------------------------------------------------------------
-        self._logger = logging.getLogger("solana").getChild(self.__class__.__name__)
+        self._http_client = http_client
+        if http_client == "requests":
+            self._session = self._requests_session()
+        elif http_client == "httpx":
+            self._session = self._httpx_client()
+        else:
+            raise ValueError(f"Unknown http_client {http_client!r}, use 'requests' or 'httpx'")
+
+        if prewarm:
+            self.prewarm()
+
+    # Context manager
+    # ==================================================================
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # Open connections (DNS, TCP, TLS) to both API hosts ahead of the first call
+    # ---------------------------------------------------------
+    def prewarm(self):
+        """
+        Open pooled connections to the Raydium API hosts.
+        Called on construction when prewarm=True.
+        Retries are switched off while it runs, call it before sharing the instance between threads.
+        """
+        # One short attempt per host, so an unreachable host can not stall the constructor
+        timeout = min(self._timeout, 2)
+        adapter = None
+        if self._http_client == "requests":
+            adapter = self._session.get_adapter(DATA_BASE_URL)
+            max_retries, adapter.max_retries = adapter.max_retries, Retry(0, read=False)
+        try:
+            for url in (TRANS_BASE_URL, DATA_BASE_URL):
+                try:
+                    self._session.head(url, timeout=timeout)
+                except _REQUEST_ERRORS as e:
+                    self._logger.debug("Raydium prewarm %s failed: %s", url, e)
+        finally:
+            if adapter is not None:
+                adapter.max_retries = max_retries
+
+    # Close the shared HTTP session
+    # ---------------------------------------------------------
+    def close(self):
+        """
+        Close the underlying HTTP session and release pooled connections.
+        """
+        self._session.close()
 
     # Public 
     # ==================================================================  
@@ -53,48 +145,33 @@ class RaydiumSwap:
                 Transaction for signing
         """
         try:
-            # Request transaction from Raydium
-            wallet = Pubkey.from_string(wallet_pub_key)
-
-            in_mint = Pubkey.from_string(input_mint)
-            out_mint = Pubkey.from_string(output_mint)
-
-            input_ata = get_associated_token_address(wallet, in_mint)
-            output_ata = get_associated_token_address(wallet, out_mint)
-
-            compute_resp = self._compute_routes(input_mint, output_mint, amount_in)
+            # Rejected quotes (no route, price impact) stop here
+            compute_resp = self._compute_routes(
+                input_mint, output_mint, amount_in, enforce_price_impact=True
+            )
             if not compute_resp:
-                return False
-            
-            pi = compute_resp["data"]["priceImpactPct"]
-            if pi > self._price_impact_max:
-                return False
-            
+                return compute_resp
+
             priority_fee = self._unit_price_micro_lamports("h")
 
             if not priority_fee:
                 priority_fee = "15000"
-            
-            payload = {
-                "wallet": str(wallet),
-                "inputAccount": str(input_ata),
-                "outputAccount": str(output_ata),
-                "txVersion": "V0",
-                "wrapSol" : True,
-                "unwrapSol": True,
-                "computeUnitPriceMicroLamports": priority_fee,
-                "swapResponse": compute_resp
-            }
-            resp_trx = requests.post(TRX_API_URL, json=payload, timeout=self._timeout)
-            resp_js = self._response_json(resp_trx)
-            if not resp_js:
+
+            # Request transaction from Raydium
+            payload = _swap_payload(
+                wallet_pub_key, input_mint, output_mint, priority_fee, compute_resp
+            )
+            resp_trx = self._post_json(TRX_API_URL, payload)
+            resp_js = _parse_response(resp_trx, self._logger)
+            if resp_js is None:
                 return False
-            print(resp_js["data"])
+            self._logger.debug("swap response data: %s", resp_js["data"])
 
             return resp_js["data"]["transaction"]
                 
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             self._logger.error(f"Raydium generate_transaction() error: {e}")
+            return False
 
     # Return price  
     # ---------------------------------------------------------
@@ -120,10 +197,8 @@ class RaydiumSwap:
         try:
             resp_js = self._compute_routes(input_mint, output_mint, amount_in)
             if not resp_js:
-                return False #No route find
-            
-            if resp_js["data"] is None:
-                return False
+                return resp_js # None: no route, False: error
+
             d = resp_js["data"]
             in_amm = float(d["inputAmount"])
             out_amm = float(d["outputAmount"])
@@ -131,8 +206,9 @@ class RaydiumSwap:
 
             return price
     
-        except Exception as e:
+        except (*_REQUEST_ERRORS, ZeroDivisionError) as e:
             self._logger.error(f"Raydium get_price() error: {e}")
+            return False
     
     # Get list of rpcs
     # ---------------------------------------------------------
@@ -150,15 +226,16 @@ class RaydiumSwap:
         """
         try:
             url = f"{DATA_BASE_URL}/main/rpcs"
-            resp = requests.get(url)
-            resp_js = self._response_json(resp)
-            if not resp_js:
+            resp = self._session.get(url, timeout=self._timeout)
+            resp_js = _parse_response(resp, self._logger)
+            if resp_js is None:
                 return False
             
             return resp_js["data"]["rpcs"]
     
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             self._logger.error(f"Raydium get_rpcs() error: {e}")
+            return False
 
     # Return data of pools used in routing
     # ---------------------------------------------------------
@@ -209,24 +286,28 @@ class RaydiumSwap:
 
             routes = self.get_routes(input_mint, output_mint, amount_in)
             if not routes:
-                return False
+                return routes
             ids = []
             for route in routes:
                 ids.append(route["poolId"])
 
-            ids_str = ", ".join(ids)
-            params= {"ids" : ids_str}
+            missing = self._missing_pool_ids(ids)
+            # Fetch uncached pools in batches to keep the URL short
+            for i in range(0, len(missing), POOL_IDS_BATCH):
+                params= {"ids" : ",".join(missing[i:i + POOL_IDS_BATCH])}
 
-            resp = requests.get(url, params=params)
-            resp_js = self._response_json(resp)
+                resp = self._session.get(url, params=params, timeout=self._timeout)
+                resp_js = _parse_response(resp, self._logger)
 
-            if not resp_js:
-                return False
+                if resp_js is None:
+                    return False
+                self._store_pools(resp_js["data"])
             
-            return resp_js["data"]
+            return self._cached_pools(ids)
         
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             self._logger.error(f"Raydium get_pools_info() error: {e}")
+            return False
 
     # Return rout plan 
     # ---------------------------------------------------------
@@ -261,25 +342,68 @@ class RaydiumSwap:
         try:
             resp_js = self._compute_routes(input_mint, output_mint, amount_in)
             if not resp_js:
-                return False #No rout find
-            
-            if resp_js["data"] is None:
-                return False
+                return resp_js # None: no route, False: error
             
-            return resp_js["data"]["routePlan"]
+            # Copy so callers can not modify the cached quote
+            return copy.deepcopy(resp_js["data"]["routePlan"])
     
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             self._logger.error(f"Raydium get_routes() error: {e}")
+            return False
 
     # Helpers
     # ==================================================================
+    # requests session with pooled, retrying adapter
+    # ---------------------------------------------------------
+    def _requests_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "POST"],
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({
+            "Connection": "keep-alive",
+            "Accept-Encoding": "gzip, deflate",
+        })
+        return session
+
+    # httpx client multiplexing requests over HTTP/2
+    # ---------------------------------------------------------
+    def _httpx_client(self) -> "httpx.Client":
+        if httpx is None:
+            raise ImportError("http_client='httpx' requires httpx: pip install httpx[http2]")
+        return httpx.Client(
+            http2=True,
+            timeout=self._timeout,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=32),
+        )
+
+    # POST a serialized JSON body
+    # ---------------------------------------------------------
+    def _post_json(self, url: str, body: bytes):
+        headers = {"Content-Type": "application/json"}
+        if self._http_client == "httpx":
+            return self._session.post(url, content=body, headers=headers, timeout=self._timeout)
+        return self._session.post(url, data=body, headers=headers, timeout=self._timeout)
+
     # Get swapResponse routes for making a swap
     # ---------------------------------------------------------
     def _compute_routes(
         self,
         input_mint: str,
         output_mint: str,
-        amount_in: int
+        amount_in: int,
+        enforce_price_impact: bool = False,
     ) -> dict:
         """
         Compute exchange routs.
@@ -288,59 +412,58 @@ class RaydiumSwap:
             input_mint: SPL token mint address (string)
             output_mint: SPL token mint address (string)
             amount_in: amount in smallest units (e.g. USDC = 6 decimals)
+            enforce_price_impact: return None if price impact is over the limit
 
         Returns:
-            swapResponse
+            swapResponse, None if there is no route, False on error.
+            The dict is shared with the quote cache and must not be modified.
         """
         try:
-            params = {
-                "inputMint": input_mint,
-                "outputMint": output_mint,
-                "amount": amount_in,
-                "slippageBps": self._slippage_bps,
-                "txVersion": "V0"
-            }
-
-            resp = requests.get(
-                QUOTE_API_URL,
-                params=params,
-                timeout=self._timeout,
-            )
-            
-            resp_js = self._response_json(resp)
-            if not resp_js: # no data
-                return False
-
-            pi = resp_js["data"]["priceImpactPct"]
-            if pi > self._price_impact_max:
-                self._logger.warning(f"Price impact is higher than the limit {pi} > {self._price_impact_max}")
-            return resp_js                
-    
-        except Exception as e:
+            key = self._quote_key(input_mint, output_mint, amount_in)
+            resp_js = self._cached_quote(key)
+            if resp_js is None:
+                params = {
+                    "inputMint": input_mint,
+                    "outputMint": output_mint,
+                    "amount": amount_in,
+                    "slippageBps": self._slippage_bps,
+                    "txVersion": "V0"
+                }
+
+                resp = self._session.get(
+                    QUOTE_API_URL,
+                    params=params,
+                    timeout=self._timeout,
+                )
+
+                resp_js = _parse_response(resp, self._logger)
+                if resp_js is None:
+                    return False
+
+                self._store_quote(key, resp_js)
+
+            return self._check_quote(resp_js, enforce_price_impact)
+
+        except _REQUEST_ERRORS as e:
             self._logger.error(f"Raydium _compute_routes() error: {e}")
+            return False
     
     # Get auto-fee calculation select m h vh
     # ---------------------------------------------------------
-    def _unit_price_micro_lamports(select: str = "h"):
-        url = f"{DATA_BASE_URL}/main/auto-fee"
-        resp = requests.get(url)
-        if resp.status_code == 200:
-            resp_js = resp.json()
-            if resp_js["success"]: 
-                return resp_js["data"]["default"][select]
-        return False
-
-    # Generate dict from response if successful
-    # ---------------------------------------------------------
-    def _response_json(self, resp: Response) -> dict:   
-        if not resp.status_code == 200:
-            self._logger.error(f"Response error status code: {resp.status_code}")
-            return False        
-        resp_js = resp.json()    
-              
-        if not resp_js["success"]:
-            self._logger.error(f"Response unsuccessful id: {resp_js["id"]}")
-            return False
+    def _unit_price_micro_lamports(self, select: str = "h"):
+        fee = self._cached_fee(select)
+        if fee is not None:
+            return fee
+
+        try:
+            url = f"{DATA_BASE_URL}/main/auto-fee"
+            resp = self._session.get(url, timeout=self._timeout)
+            resp_js = _parse_response(resp, self._logger)
+            if resp_js is None:
+                return False
 
-        return resp_js
-        
\ No newline at end of file
+            return self._store_fees(resp_js["data"]["default"], select)
+
+        except _REQUEST_ERRORS as e:
+            self._logger.error(f"Raydium _unit_price_micro_lamports() error: {e}")
+            return False